@@ -30,6 +30,18 @@ options:
     - name: ANSIBLE_HTTPAPI_LOGIN_DOMAIN
     vars:
     - name: ansible_httpapi_login_domain
+  use_orjson:
+    description:
+    - Parse the JSON responses of ND with the orjson library instead of the standard json library.
+    - This speeds up the processing of large responses and requires the orjson python package on the Ansible control node.
+    - The standard json library is used when orjson is not installed.
+    type: boolean
+    default: false
+    env:
+    - name: ANSIBLE_HTTPAPI_USE_ORJSON
+    vars:
+    - name: ansible_httpapi_use_orjson
+    version_added: 1.4.0
 """
 
 import os
@@ -52,6 +64,13 @@ try:
 except ImportError:
     HAS_MULTIPART_ENCODER = False
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 if sys.version_info.major == 2:
     from StringIO import StringIO  # For Python 2+
 else:
@@ -404,14 +423,17 @@ class HttpApi(HttpApiBase):
             response_value = response_data.getvalue()
         except Exception:
             response_value = response_data
-        response_text = to_text(response_value)
         try:
+            # orjson parses the raw bytes directly and avoids decoding the response to text first
+            if HAS_ORJSON and isinstance(response_value, bytes) and self.get_option("use_orjson"):
+                return orjson.loads(response_value) if response_value else {}
+            response_text = to_text(response_value)
             return json.loads(response_text) if response_text else {}
         # JSONDecodeError only available on Python 3.5+
         except Exception as e:
             # Expose RAW output for troubleshooting
             self.error = dict(code=-1, message="Unable to parse output as JSON, see 'raw' output. {0}".format(e))
-            self.info["raw"] = response_text
+            self.info["raw"] = to_text(response_value)
             return
 
     def _get_formated_info(self, response):
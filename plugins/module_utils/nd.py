@@ -12,9 +12,11 @@ from functools import reduce
 __metaclass__ = type
 
 from copy import deepcopy
+import hashlib
 import os
 import shutil
 import tempfile
+import time
 from ansible.module_utils.basic import json
 from ansible.module_utils.basic import env_fallback
 from ansible.module_utils.six import PY3
@@ -22,7 +24,7 @@ from ansible.module_utils.six.moves import filterfalse
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils._text import to_native, to_text
 from ansible.module_utils.connection import Connection
-from ansible_collections.cisco.nd.plugins.module_utils.constants import ALLOWED_STATES_TO_APPEND_SENT_AND_PROPOSED
+from ansible_collections.cisco.nd.plugins.module_utils.constants import ALLOWED_STATES_TO_APPEND_SENT_AND_PROPOSED, ND_CACHE_DIR
 
 
 def sanitize_dict(dict_to_sanitize, keys=None, values=None, recursive=True, remove_none_values=True):
@@ -195,6 +197,31 @@ def write_file(module, dest, content):
 
 
 class NDModule(object):
+    # Fixed set of attributes, which avoids a per-instance __dict__ for the result buffers
+    __slots__ = (
+        "module",
+        "params",
+        "result",
+        "headers",
+        "existing",
+        "jsondata",
+        "error",
+        "previous",
+        "proposed",
+        "sent",
+        "stdout",
+        "has_modified",
+        "filter_string",
+        "method",
+        "path",
+        "response",
+        "status",
+        "url",
+        "httpapi_logs",
+        "connection",
+        "from_cache",
+    )
+
     def __init__(self, module):
         self.module = module
         self.params = module.params
@@ -224,10 +251,23 @@ class NDModule(object):
         self.url = None
         self.httpapi_logs = list()
 
+        # httpapi connection
+        self.connection = None
+
+        # on-disk cache, whether the last query_cached_obj() call was served from the cache
+        self.from_cache = False
+
         if self.module._debug:
             self.module.warn("Enable debug output because ANSIBLE_DEBUG was set.")
             self.params["output_level"] = "debug"
 
+    def get_connection(self):
+        """Get the httpapi connection, which is created once and reused for all ND requests of the module"""
+        if self.connection is None:
+            self.connection = Connection(self.module._socket_path)
+            self.connection.set_params(self.params)
+        return self.connection
+
     def request(
         self, path, method=None, data=None, file=None, qs=None, prefix="", file_key="file", output_format="json", ignore_not_found_error=False, file_ext=None
     ):
@@ -241,8 +281,7 @@ class NDModule(object):
         if method == "PATCH" and not data:
             return {}
 
-        conn = Connection(self.module._socket_path)
-        conn.set_params(self.params)
+        conn = self.get_connection()
         uri = self.path
         if prefix != "":
             uri = "{0}/{1}".format(prefix, self.path)
@@ -366,6 +405,48 @@ class NDModule(object):
                 return {}
         return obj
 
+    def get_cache_file(self, path, prefix=""):
+        """Get the location of the on-disk cache file for a path on the ND host"""
+        host = self.params.get("host")
+        if host is None:
+            host = self.get_connection().get_option("host")
+        port = self.params.get("port")
+        if port is None:
+            port = self.get_connection().get_option("port")
+        cache_key = hashlib.sha1(to_text("{0}:{1}{2}{3}".format(host, port, prefix, path)).encode("utf-8")).hexdigest()
+        return os.path.join(os.path.expanduser(ND_CACHE_DIR), "{0}.json".format(cache_key))
+
+    def query_cached_obj(self, path, ttl, refresh=False, **kwargs):
+        """Query the ND REST API for the whole object at a path and cache it on disk for ttl seconds, refresh bypasses the cached object"""
+        self.from_cache = False
+        if not ttl:
+            return self.query_obj(path, **kwargs)
+
+        cache_file = self.get_cache_file(path, kwargs.get("prefix", ""))
+        if not refresh:
+            try:
+                with open(cache_file, "r") as f:
+                    cached = json.load(f)
+                if cached.get("expires", 0) > time.time():
+                    self.from_cache = True
+                    return cached.get("body")
+            except Exception:
+                # A missing or unreadable cache file is a cache miss
+                pass
+
+        obj = self.query_obj(path, **kwargs)
+        # Check mode does not leave any files behind on the controller
+        if obj and not self.module.check_mode:
+            try:
+                if not os.path.isdir(os.path.dirname(cache_file)):
+                    os.makedirs(os.path.dirname(cache_file), 0o700)
+                with os.fdopen(os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+                    json.dump(dict(expires=time.time() + ttl, body=obj), f)
+            except Exception:
+                # Caching is best effort, the queried object is returned regardless
+                pass
+        return obj
+
     def get_obj(self, path, **kwargs):
         """Get a specific object from a set of ND REST objects"""
         objs = self.query_objs(path, **kwargs)
@@ -50,6 +50,14 @@ options:
           - Default value is set to DefaultAuth.
         type: str
         default: "DefaultAuth"
+  use_cache:
+    description:
+      - Cache the name of the local cluster on the Ansible control node for 10 minutes.
+      - The cache avoids a request to the local cluster on each task and is refreshed when the cached name does not match the federation.
+      - Disable the cache when the Nexus Dashboard is rebuilt or renamed frequently, for example in lab environments.
+    type: bool
+    default: true
+    version_added: "1.4.0"
   state:
     description:
       - The state of the cluster configuration.
@@ -61,6 +69,8 @@ extends_documentation_fragment:
 - cisco.nd.check_mode
 notes:
 - The M(cisco.aci.nd_federation) module can be used for this.
+- When O(use_cache=true), the name of the local cluster is stored in C(~/.ansible/nd_cache) on the Ansible control node.
+  The cache files are not written in check mode and can be removed at any time to clear the cache.
 """
 
 EXAMPLES = r"""
@@ -111,6 +121,22 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.nd.plugins.module_utils.nd import NDModule, nd_argument_spec
 import base64
 
+LOCAL_CLUSTER_CACHE_TTL = 600
+
+
+def get_member_paths(member_path, members):
+    """Build the API paths of the federation members to delete"""
+    return ["{0}/{1}".format(member_path, member.get("status").get("memberID")) for member in members]
+
+
+def get_local_cluster_name(nd, use_cache, refresh=False):
+    """Get the name of the local cluster and whether it was read from the cache on the Ansible control node"""
+    ttl = LOCAL_CLUSTER_CACHE_TTL if use_cache else 0
+    local_cluster_obj = nd.query_cached_obj("/nexus/infra/api/platform/v1/clusters", ttl, refresh=refresh)
+    if len(local_cluster_obj.get("items", [])) == 1:
+        return local_cluster_obj.get("items")[0].get("spec", {}).get("name"), nd.from_cache
+    return "", nd.from_cache
+
 
 def main():
     argument_spec = nd_argument_spec()
@@ -125,6 +151,7 @@ def main():
                 login_domain=dict(type="str", default="DefaultAuth"),
             ),
         ),
+        use_cache=dict(type="bool", default=True),
         state=dict(type="str", default="present", choices=["absent", "present", "query"]),
     )
 
@@ -140,38 +167,61 @@ def main():
 
     clusters = nd.params.get("clusters") if nd.params.get("clusters") is not None else []
     state = nd.params.get("state")
-
-    for cluster in clusters:
-        if state == "present" and not (cluster.get("username") and cluster.get("password")):
-            nd.fail_json(msg="'username' and 'password' are required when state is present.")
+    use_cache = nd.params.get("use_cache")
+
+    # Keep a single entry per hostname so that a duplicated cluster is not added twice, the last entry wins
+    unique_clusters = list(dict((cluster.get("hostname"), cluster) for cluster in clusters).values())
+    if len(unique_clusters) != len(clusters):
+        module.warn("Duplicate hostnames were found in 'clusters', only the last entry of each hostname is used.")
+        clusters = unique_clusters
+
+    # 'hostname' is always required by the argument spec, credentials are only needed to add members
+    if state == "present":
+        required_keys = ("username", "password")
+        invalid_cluster = next((cluster for cluster in clusters if not all(cluster.get(key) for key in required_keys)), None)
+        if invalid_cluster:
+            missing_keys = " and ".join("'{0}'".format(key) for key in required_keys if not invalid_cluster.get(key))
+            nd.fail_json(msg="Missing {0} for cluster '{1}' when state is present.".format(missing_keys, invalid_cluster.get("hostname")))
 
     federation_path = "/nexus/api/federation/v4/federations"
     member_path = "/nexus/api/federation/v4/members"
 
-    # GET local cluster name
-    local_cluster_name = ""
-    local_cluster_obj = nd.query_obj("/nexus/infra/api/platform/v1/clusters")
-    if len(local_cluster_obj.get("items", [])) == 1:
-        local_cluster_name = local_cluster_obj.get("items")[0].get("spec", {}).get("name")
-
-    # GET federation
-    federation_obj = nd.query_obj(federation_path, ignore_not_found_error=True).get("items")
-
-    # If federation exists, verify if local_cluster is the primary
-    if federation_obj:
-        federation_info = next((federation_dict for federation_dict in federation_obj if federation_dict.get("spec").get("name") == local_cluster_name), None)
-        if not federation_info and state != "query":
-            nd.fail_json(msg="Local cluster is not the primary cluster in the federation. Cannot add/remove a member to this federation.")
-
     # Get federation members
-    federation_member_obj = nd.query_obj(member_path, ignore_not_found_error=True).get("items")
+    federation_member_obj = nd.query_obj(member_path, ignore_not_found_error=True).get("items") or []
+
+    # GET local cluster name and federation, both are only required to add/remove members
+    # Absent state without members is a no-op, also in check mode, so these requests are skipped
+    local_cluster_name = ""
+    local_cluster_name_cached = False
+    federation_obj = None
+    federation_info = None
+    remote_members = []
+    if state == "present" or (state == "absent" and federation_member_obj):
+        # The local cluster name rarely changes, cache it across runs to avoid a request per task
+        local_cluster_name, local_cluster_name_cached = get_local_cluster_name(nd, use_cache)
+
+        # GET federation
+        federation_obj = nd.query_obj(federation_path, ignore_not_found_error=True).get("items")
+
+        # If federation exists, verify if local_cluster is the primary
+        if federation_obj:
+            federations_by_name = dict((federation_dict.get("spec").get("name"), federation_dict) for federation_dict in federation_obj)
+            federation_info = federations_by_name.get(local_cluster_name)
+            if not federation_info and local_cluster_name_cached:
+                # The cached name is stale when the local cluster was rebuilt or renamed
+                local_cluster_name, local_cluster_name_cached = get_local_cluster_name(nd, use_cache, refresh=True)
+                federation_info = federations_by_name.get(local_cluster_name)
+            if not federation_info:
+                nd.fail_json(msg="Local cluster is not the primary cluster in the federation. Cannot add/remove a member to this federation.")
+
+        # The local cluster is a member of its own federation and is never removed on its own
+        remote_members = [member for member in federation_member_obj if member.get("spec").get("host") != local_cluster_name]
 
     # Query specific member
     if clusters and state == "query" and federation_member_obj:
+        members_by_host = dict((cluster_dict.get("spec").get("host"), cluster_dict) for cluster_dict in federation_member_obj)
         for cluster in clusters:
-            cluster_info = next(
-                (cluster_dict for cluster_dict in federation_member_obj if cluster_dict.get("spec").get("host") == cluster.get("hostname")), None
-            )
+            cluster_info = members_by_host.get(cluster.get("hostname"))
             if cluster_info:
                 nd.existing = cluster_info
     else:
@@ -184,13 +234,11 @@ def main():
     elif state == "absent":
         if nd.existing:
             if not module.check_mode:
-                for member_host in federation_member_obj:
-                    if not member_host.get("spec").get("host") == local_cluster_name:
-                        cluster_member_path = "{0}/{1}".format(member_path, member_host.get("status").get("memberID"))
-                        nd.request(cluster_member_path, method="DELETE")
+                for cluster_member_path in get_member_paths(member_path, remote_members):
+                    nd.request(cluster_member_path, method="DELETE")
 
-                # Remove the federation if there are no more members.
-                if len(nd.query_obj(member_path, ignore_not_found_error=True).get("items")) == 1:
+                # Remove the federation if there are no more members, only the local cluster is left after the deletions.
+                if any(member.get("spec").get("host") == local_cluster_name for member in federation_member_obj):
                     if federation_info:
                         nd.request("{0}/{1}".format(federation_path, federation_info.get("status").get("federationID")), method="DELETE")
             nd.existing = {}
@@ -198,57 +246,67 @@ def main():
     elif state == "present":
         payload_dict = {"DELETE": [], "POST": []}
 
+        # Index existing and user-specified members by host to compute the membership diff with dict lookups.
+        existing_members = dict((existing_member.get("spec").get("host"), existing_member) for existing_member in federation_member_obj)
+        user_members = dict((user_member.get("hostname"), user_member) for user_member in clusters)
+
+        remove_member_list = [member for member in remote_members if member.get("spec").get("host") not in user_members]
+        add_member_list = [member for host, member in user_members.items() if host not in existing_members]
+
+        # Nothing to add or remove, the members are already in the desired state
+        if not (add_member_list or remove_member_list):
+            nd.existing = nd.previous
+            nd.proposed = payload_dict
+            nd.exit_json()
+
         # Remove existing members not specified by the users.
-        for existing_member_hosts in federation_member_obj:
-            member_host = existing_member_hosts.get("spec").get("host")
-            if member_host != local_cluster_name:
-                # Use next() to check if the member exists in user-specified clusters
-                member_exists = next((True for user_member_host in clusters if user_member_host.get("hostname") == member_host), False)
-                if not member_exists:
-                    cluster_member_path = "{0}/{1}".format(member_path, existing_member_hosts.get("status").get("memberID"))
-                    nd.request(cluster_member_path, method="DELETE")
-                    payload_dict["DELETE"].append(cluster_member_path)
+        payload_dict["DELETE"] = get_member_paths(member_path, remove_member_list)
+        if not module.check_mode:
+            for cluster_member_path in payload_dict["DELETE"]:
+                nd.request(cluster_member_path, method="DELETE")
 
         # Add members specified by the users.
-        for user_member_host in clusters:
-            # Use next() to check if the user-specified member exists in existing members
-            found = next(
-                (True for existing_member_hosts in federation_member_obj if existing_member_hosts.get("spec").get("host") == user_member_host.get("hostname")),
-                False,
+        encoded_passwords = dict((member.get("hostname"), base64.b64encode(member.get("password").encode()).decode("ascii")) for member in add_member_list)
+        for user_member_host in add_member_list:
+            cluster_payload = dict(
+                spec=dict(
+                    host=user_member_host.get("hostname"),
+                    userName=user_member_host.get("username"),
+                    password=encoded_passwords.get(user_member_host.get("hostname")),
+                    loginDomain=user_member_host.get("login_domain"),
+                ),
             )
-            if not found:
-                cluster_payload = dict(
-                    spec=dict(
-                        host=user_member_host.get("hostname"),
-                        userName=user_member_host.get("username"),
-                        password=(base64.b64encode(str.encode(user_member_host.get("password")))).decode("utf-8"),
-                        loginDomain=user_member_host.get("login_domain"),
-                    ),
-                )
-
-                payload = cluster_payload
+            payload_dict["POST"].append(cluster_payload)
 
-                payload_dict["POST"].append(payload)
+        # The payloads cannot be diffed against the members list, so they are sent as they are
+        nd.sent = payload_dict["POST"]
 
-                nd.sanitize(payload, collate=True)
-
-                if not module.check_mode:
-                    # If federation does not exist, create a new federation
-                    if not federation_obj:
-                        nd.request(federation_path, method="POST", data={"spec": {"name": local_cluster_name}})
-                    nd.request(member_path, method="POST", data=payload)
+        added_members = []
+        federation_created = False
+        if not module.check_mode:
+            # If federation does not exist, create a new federation once before adding the members
+            if payload_dict["POST"] and not federation_obj:
+                # The federation is named after the local cluster, so a possibly stale cached name is not used
+                if local_cluster_name_cached:
+                    local_cluster_name, local_cluster_name_cached = get_local_cluster_name(nd, use_cache, refresh=True)
+                nd.request(federation_path, method="POST", data={"spec": {"name": local_cluster_name}})
+                federation_created = True
+            for payload in payload_dict["POST"]:
+                added_members.append(nd.request(member_path, method="POST", data=payload))
 
         if not module.check_mode:
-            nd.existing = nd.query_obj(member_path, ignore_not_found_error=True).get("items")
+            # Build the current members from the known mutations since the POST responses echo the created members.
+            # A newly created federation also adds the local cluster as a member, so the members are queried again in that case.
+            if not federation_created and all(added_members):
+                removed_hosts = set(member.get("spec").get("host") for member in remove_member_list)
+                nd.existing = [member for member in federation_member_obj if member.get("spec").get("host") not in removed_hosts] + added_members
+            else:
+                nd.existing = nd.query_obj(member_path, ignore_not_found_error=True).get("items")
             nd.proposed = payload_dict
 
         else:
             nd.existing = nd.proposed = payload_dict
 
-        # Verifies that the payload is not modified but the order of elements in current and previous lists are interchanged.
-        if payload_dict["DELETE"] == [] and payload_dict["POST"] == []:
-            nd.has_modified = True
-
     nd.exit_json()
 
 